@@ -1,11 +1,14 @@
 # app.py
 import os
-import json
-from flask import Flask, render_template, jsonify, request
+import gzip
+import hashlib
+from functools import lru_cache
+from flask import Flask, Response, render_template, request
+import orjson
 import pandas as pd
 import joblib
 import folium
-from folium.features import GeoJson, GeoJsonTooltip, GeoJsonPopup
+from folium.features import GeoJsonTooltip, GeoJsonPopup
 import numpy as np
 import traceback
 
@@ -30,13 +33,20 @@ def safe_load_csv(path):
 
 def safe_load_geojson(path):
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
     except Exception as e:
         print(f"[WARN] Gagal load GeoJSON {path}: {e}")
         traceback.print_exc()
         return {"type": "FeatureCollection", "features": []}
 
+# ---------- Helper: JSON responses via orjson ----------
+def json_bytes(obj):
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+
+def fastjson(obj, status=200):
+    return Response(json_bytes(obj), status=status, mimetype="application/json")
+
 # ---------- Paths (pastikan ada di repo) ----------
 MODEL_PATH = os.path.join("models", "model_stok_ikan.joblib")
 CSV_PATH = os.path.join("data", "data_hasil_klasifikasi.csv")
@@ -54,12 +64,24 @@ if not df.empty:
     # ensure Provinsi column exists
     if "Provinsi" in df.columns:
         df["Provinsi"] = df["Provinsi"].astype(str).str.upper()
-    # ensure Tahun as int if possible
-    if "Tahun" in df.columns:
-        try:
-            df["Tahun"] = df["Tahun"].astype(int)
-        except Exception:
-            pass
+    # ensure Tahun as int and narrow numeric columns if possible (halves memory traffic per mean/sum)
+    numeric_dtypes = {
+        "Tahun": "int16",
+        "TP_C": "float32",
+        "TP_E": "float32",
+        "Effort (kapal)": "float32",
+        "CPUE (Ton/Trip)": "float32",
+    }
+    for col, dtype in numeric_dtypes.items():
+        if col in df.columns:
+            try:
+                df[col] = df[col].astype(dtype)
+            except Exception:
+                pass
+    # low-cardinality text columns as categoricals: int-code compares and groupby keys
+    for col in ["Provinsi", "Kelompok Ikan", "Status"]:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
 
 # Features expected by the model (keep as reference)
 fitur_input_model = [
@@ -71,6 +93,85 @@ fitur_input_model = [
     "Tahun",
 ]
 
+# Column order the model was fitted with (numeric features + the one-hot encoded categoricals)
+FEAT_ORDER = list(getattr(model, "feature_names_in_", fitur_input_model + ["Provinsi", "Kelompok Ikan"]))
+
+def make_predictor(model):
+    """Return a predict(X) callable for the loaded model, warmed on one row of df.
+
+    Samplers such as SMOTE only act during fit, so for a pipeline only the
+    transform steps and the final estimator are run at predict time.
+    """
+    if model is None:
+        return None
+    steps = getattr(model, "steps", None)
+    if steps:
+        transformers = [est for _, est in steps[:-1] if hasattr(est, "transform")]
+        estimator = steps[-1][1]
+
+        def predict(X):
+            for transformer in transformers:
+                X = transformer.transform(X)
+            return estimator.predict(X)
+    else:
+        predict = model.predict
+
+    if not df.empty and set(FEAT_ORDER).issubset(df.columns):
+        try:
+            predict(df[FEAT_ORDER].head(1))
+        except Exception as e:
+            print(f"[WARN] Gagal warm-up model: {e}")
+    return predict
+
+predict_model = make_predictor(model)
+
+# df is never mutated after load, so the status-ikan payload is serialized once
+kolom_status_ikan = [k for k in ["Tahun", "Kelompok Ikan", "Provinsi", "MSY", "TP", "Status"] if k in df.columns]
+STATUS_IKAN_JSON = json_bytes(df[kolom_status_ikan].astype(object).fillna("").to_dict(orient="records")) if not df.empty else b"[]"
+
+# Filter option lists for the page templates; constant for the life of the process
+TAHUN_LIST = sorted(df["Tahun"].dropna().unique().tolist()) if not df.empty and "Tahun" in df.columns else []
+PROVINSI_LIST = sorted(df["Provinsi"].dropna().unique().tolist()) if not df.empty and "Provinsi" in df.columns else []
+IKAN_LIST = sorted(df["Kelompok Ikan"].dropna().unique().tolist()) if not df.empty and "Kelompok Ikan" in df.columns else []
+
+# Sorted (Tahun, Provinsi, Kelompok Ikan) -> row position index, so filters are index slices instead of full scans
+INDEX_COLS = ["Tahun", "Provinsi", "Kelompok Ikan"]
+ROW_INDEX = (
+    pd.Series(np.arange(len(df)), index=pd.MultiIndex.from_frame(df[INDEX_COLS])).sort_index()
+    if set(INDEX_COLS).issubset(df.columns)
+    else None
+)
+
+def filter_df(tahun=None, provinsi=None, ikan=None):
+    """Rows of df matching the given keys (None = no filter), in original order."""
+    if ROW_INDEX is None:
+        # an index column is missing: plain boolean masks, so only a filter on that column fails
+        mask = np.ones(len(df), dtype=bool)
+        for col, v in zip(INDEX_COLS, (tahun, provinsi, ikan)):
+            if isinstance(v, slice):
+                mask &= df[col].between(v.start, v.stop).to_numpy()
+            elif v is not None:
+                mask &= (df[col] == v).to_numpy()
+        return df[mask]
+    key = tuple(slice(None) if v is None else v for v in (tahun, provinsi, ikan))
+    try:
+        pos = np.atleast_1d(ROW_INDEX.loc[key])
+    except KeyError:
+        return df.iloc[0:0]
+    return df.iloc[np.sort(pos)]
+
+def parse_filter_args(args):
+    """Normalize tahun/provinsi/ikan query args into (int|None, str|None, str|None) filter keys."""
+    tahun = (args.get("tahun") or "").strip()
+    provinsi = (args.get("provinsi") or "").strip()
+    ikan = (args.get("ikan") or "").strip()
+    # same rules as int(): signed years still filter (and match nothing), unparsable ones are ignored
+    try:
+        tahun_key = int(tahun) if tahun else None
+    except ValueError:
+        tahun_key = None
+    return (tahun_key, provinsi.upper() or None, ikan or None)
+
 # ---------- Routes ----------
 @app.route("/")
 def home():
@@ -82,64 +183,46 @@ def about():
 
 @app.route("/dashboard")
 def dashboard():
-    tahun_list = sorted(df["Tahun"].dropna().unique()) if not df.empty and "Tahun" in df.columns else []
-    provinsi_list = sorted(df["Provinsi"].dropna().unique()) if not df.empty and "Provinsi" in df.columns else []
-    ikan_list = sorted(df["Kelompok Ikan"].dropna().unique()) if not df.empty and "Kelompok Ikan" in df.columns else []
     return render_template(
         "dashboard.html",
-        tahun_list=tahun_list,
-        provinsi_list=provinsi_list,
-        ikan_list=ikan_list,
+        tahun_list=TAHUN_LIST,
+        provinsi_list=PROVINSI_LIST,
+        ikan_list=IKAN_LIST,
     )
 
 @app.route("/api/dashboard-populasi")
 def api_dashboard_populasi():
-    tahun = request.args.get("tahun")
-    provinsi = request.args.get("provinsi")
-    ikan = request.args.get("ikan")
+    return Response(dashboard_populasi_json(*parse_filter_args(request.args)), mimetype="application/json")
 
+@lru_cache(maxsize=512)
+def dashboard_populasi_json(tahun, provinsi, ikan):
     if df.empty:
-        return jsonify([])
+        return b"[]"
 
-    df_dashboard = df.copy()
-    # safe compute Populasi if columns exist
+    df_dashboard = filter_df(tahun, provinsi, ikan)
+    # safe compute Populasi if columns exist (straight from the filtered TP_C/TP_E arrays);
+    # like mean(axis=1), a missing value falls back to the other column
     if {"TP_C", "TP_E"}.issubset(df_dashboard.columns):
-        df_dashboard["Populasi"] = df_dashboard[["TP_C", "TP_E"]].mean(axis=1)
+        tp_c = df_dashboard["TP_C"].to_numpy()
+        tp_e = df_dashboard["TP_E"].to_numpy()
+        populasi = np.where(np.isnan(tp_c), tp_e, np.where(np.isnan(tp_e), tp_c, (tp_c + tp_e) * 0.5))
     else:
-        df_dashboard["Populasi"] = 0
+        populasi = np.zeros(len(df_dashboard))
 
-    if tahun and tahun.strip():
-        try:
-            df_dashboard = df_dashboard[df_dashboard["Tahun"] == int(tahun)]
-        except Exception:
-            pass
-    if provinsi and provinsi.strip():
-        df_dashboard = df_dashboard[df_dashboard["Provinsi"] == provinsi.upper()]
-    if ikan and ikan.strip():
-        df_dashboard = df_dashboard[df_dashboard["Kelompok Ikan"] == ikan]
-
-    cols = [c for c in ["Tahun", "Kelompok Ikan", "Provinsi", "Populasi"] if c in df_dashboard.columns]
-    result = (
-        df_dashboard[cols]
-        .rename(columns={"Tahun": "tahun", "Kelompok Ikan": "kelompok_ikan", "Provinsi": "provinsi", "Populasi": "populasi"})
-        .to_dict(orient="records")
-    )
-    return jsonify(result)
+    rename = {"Tahun": "tahun", "Kelompok Ikan": "kelompok_ikan", "Provinsi": "provinsi"}
+    columns = {rename[c]: df_dashboard[c].tolist() for c in rename if c in df_dashboard.columns}
+    columns["populasi"] = populasi.tolist()
+    result = [dict(zip(columns, row)) for row in zip(*columns.values())]
+    return json_bytes(result)
 
 @app.route("/api/status-ikan")
 def api_status_ikan():
-    if df.empty:
-        return jsonify([])
-
-    kolom_yang_dipakai = ["Tahun", "Kelompok Ikan", "Provinsi", "MSY", "TP", "Status"]
-    kolom_ada = [k for k in kolom_yang_dipakai if k in df.columns]
-    data_filtered = df[kolom_ada].fillna("")
-    return jsonify(data_filtered.to_dict(orient="records"))
+    return Response(STATUS_IKAN_JSON, mimetype="application/json")
 
 @app.route("/api/card-infoekologi")
 def api_card_infoekologi():
     if df.empty:
-        return jsonify([])
+        return fastjson([])
 
     try:
         latest_year = int(df["Tahun"].max())
@@ -147,27 +230,38 @@ def api_card_infoekologi():
         latest_year = None
 
     if latest_year is None:
-        return jsonify([])
-
-    df_latest = df[df["Tahun"] == latest_year]
-    df_prev = df[df["Tahun"] == (latest_year - 1)]
-
-    result = []
-    for ikan in df_latest["Kelompok Ikan"].dropna().unique()[:5]:
-        pop_now_c = df_latest[df_latest["Kelompok Ikan"] == ikan]["TP_C"].mean() if "TP_C" in df_latest.columns else 0
-        pop_now_e = df_latest[df_latest["Kelompok Ikan"] == ikan]["TP_E"].mean() if "TP_E" in df_latest.columns else 0
-        pop_now = (pop_now_c + pop_now_e) / 2
-
-        pop_prev_c = df_prev[df_prev["Kelompok Ikan"] == ikan]["TP_C"].mean() if "TP_C" in df_prev.columns else 0
-        pop_prev_e = df_prev[df_prev["Kelompok Ikan"] == ikan]["TP_E"].mean() if "TP_E" in df_prev.columns else 0
-        pop_prev = (pop_prev_c + pop_prev_e) / 2
+        return fastjson([])
+
+    df_latest = filter_df(latest_year)
+    ikan_list = df_latest["Kelompok Ikan"].dropna().unique()[:5]
+
+    # one groupby over both years instead of masking per ikan
+    tp_cols = [c for c in ["TP_C", "TP_E"] if c in df.columns]
+    if tp_cols:
+        tp_mean = (
+            filter_df(slice(latest_year - 1, latest_year))
+            .groupby(["Tahun", "Kelompok Ikan"], observed=True)[tp_cols]
+            .mean()
+        )
+        # a missing column counts as 0, but a NaN mean still gives NaN, like (mean_c + mean_e) / 2
+        pop = tp_mean.sum(axis=1, min_count=len(tp_cols)).div(2).unstack("Tahun").reindex(index=ikan_list, columns=[latest_year, latest_year - 1])
+    else:
+        pop = pd.DataFrame(0.0, index=ikan_list, columns=[latest_year, latest_year - 1])
+    pop_now = pop[latest_year]
+    pop_prev = pop[latest_year - 1]
+    trend = ((pop_now - pop_prev) / pop_prev * 100).where(pop_prev.notna() & (pop_prev != 0), 0)
 
-        trend = ((pop_now - pop_prev) / pop_prev) * 100 if pop_prev else 0
-        status = df_latest[df_latest["Kelompok Ikan"] == ikan]["Status"].values[0] if "Status" in df_latest.columns else ""
+    if "Status" in df_latest.columns:
+        status = df_latest.drop_duplicates("Kelompok Ikan").set_index("Kelompok Ikan")["Status"].reindex(ikan_list)
+    else:
+        status = pd.Series("", index=ikan_list)
 
-        result.append({"nama": ikan, "populasi": round(pop_now, 2), "tren": round(trend, 2), "status": status})
+    result = [
+        {"nama": ikan, "populasi": round(p, 2), "tren": round(t, 2), "status": s}
+        for ikan, p, t, s in zip(ikan_list, pop_now.tolist(), trend.tolist(), status.tolist())
+    ]
 
-    return jsonify(result)
+    return fastjson(result)
 
 # Helper: detect province property key in GeoJSON features
 def detect_prov_property_key(features):
@@ -183,77 +277,113 @@ def detect_prov_property_key(features):
     # return the most common candidate
     return max(candidates, key=candidates.get)
 
+status_colors = {
+    "UNDERFISHING": "#2ecc71",
+    "UNCERTAIN": "#95a5a6",
+    "DATA DEFICIENT": "#95a5a6",
+    "OVERFISHING": "#e74c3c",
+    "GROWTH OVERFISHING": "#f1c40f",
+    "RECRUITMENT OVERFISHING": "#e67e22",
+}
+# Map colour per Status category code; the trailing sentinel slot is what code -1 (missing) indexes
+STATUS_COLOR_ARR = np.array(
+    [status_colors.get(str(c).upper(), "#dcdcdc") for c in (df["Status"].cat.categories if "Status" in df.columns else [])]
+    + ["#dcdcdc"],
+    dtype=object,
+)
+
+# Helper: summary text and first (status, warna) per provinsi, aggregated on the raw category codes
+def summarize_provinsi(df_filtered):
+    codes = df_filtered["Provinsi"].cat.codes.to_numpy()
+    # stable sort keeps the original row order inside each provinsi
+    order = np.argsort(codes, kind="stable")
+    order = order[codes[order] >= 0]
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.diff(sorted_codes, prepend=-1))
+    ends = np.r_[starts[1:], sorted_codes.size]
+
+    # plain arrays in group order; the catch column is checked once here, not per row
+    catch_col = "Hasil Tangkapan / Catch (Ton)"
+    catch = df_filtered[catch_col].to_numpy()[order] if catch_col in df_filtered.columns else np.zeros(order.size, dtype=np.int64)
+    ikan = df_filtered["Kelompok Ikan"].to_numpy(dtype=object)[order]
+    status = df_filtered["Status"].astype(object).fillna("").to_numpy()[order]
+    status_codes = df_filtered["Status"].cat.codes.to_numpy()[order]
+    frag = [f"{i}: {c:,} ton ({s})" for i, c, s in zip(ikan, catch.tolist(), status)]
+    # NaN catches count as 0 in the total, like groupby().sum()
+    totals = np.add.reduceat(np.nan_to_num(catch), starts) if starts.size else catch[:0]
+
+    names = df_filtered["Provinsi"].cat.categories[sorted_codes[starts]]
+    # first non-null Status per provinsi, like groupby().first(): the next row with a valid code
+    # at or after each group start, if it still falls inside that group (else code -1)
+    valid = np.append(np.flatnonzero(status_codes >= 0), status_codes.size)
+    first_pos = valid[np.searchsorted(valid, starts)]
+    first_code = np.where(first_pos < ends, np.append(status_codes, -1)[first_pos], -1)
+    first_status = np.append(df_filtered["Status"].cat.categories.to_numpy(dtype=object), "")[first_code]
+    summary = {
+        name: "<br>".join(frag[a:b]) + f"<br><br><b>Total tangkapan: {total:,.0f} ton</b>"
+        for name, a, b, total in zip(names, starts, ends, totals)
+    }
+    return summary, dict(zip(names, zip(first_status, STATUS_COLOR_ARR[first_code])))
+
+# Detect the province property key and normalize names once; each render builds its own properties.
+# Raw properties are dropped so only the normalized name is kept.
+PROP_KEY = detect_prov_property_key(geojson_data.get("features", [])) or "Provinsi"
+prov_features = []
+for feature in geojson_data.get("features", []):
+    props = feature.get("properties") or {}
+    feature["properties"] = {"Provinsi": str(props.get(PROP_KEY, props.get("Provinsi", ""))).upper()}
+    prov_features.append((feature["properties"]["Provinsi"], feature))
+prov_features = tuple(prov_features)
+
 @app.route("/api/peta-kepatuhan")
 def api_peta_kepatuhan():
-    tahun = request.args.get("tahun")
-    provinsi = request.args.get("provinsi")
-    ikan = request.args.get("ikan")
-
+    body_gz, etag = peta_kepatuhan_json(*parse_filter_args(request.args))
+    # quality, not membership: "gzip;q=0" is an explicit refusal
+    if request.accept_encodings["gzip"] > 0:
+        response = Response(body_gz, mimetype="application/json")
+        response.headers["Content-Encoding"] = "gzip"
+        etag += "-gz"
+    else:
+        response = Response(gzip.decompress(body_gz), mimetype="application/json")
+    response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = "public, max-age=300"
+    response.vary.add("Accept-Encoding")
+    return response.make_conditional(request)
+
+# Rendering the folium map dominates this endpoint and df/geojson never change, so cache per filter.
+# Only the gzip form is kept (~320 KB vs ~930 KB raw per entry); the rare client without gzip
+# gets it decompressed on the fly.
+@lru_cache(maxsize=128)
+def peta_kepatuhan_json(tahun, provinsi, ikan):
+    body = render_peta_kepatuhan(tahun, provinsi, ikan)
+    return gzip.compress(body, 6), hashlib.blake2b(body, digest_size=8).hexdigest()
+
+def render_peta_kepatuhan(tahun, provinsi, ikan):
     if df.empty or not geojson_data.get("features"):
-        return jsonify({"html": "<p>Data peta atau dataset tidak tersedia.</p>"})
+        return json_bytes({"html": "<p>Data peta atau dataset tidak tersedia.</p>"})
 
-    df_filtered = df.copy()
-    # ensure uppercase provinsi column
-    if "Provinsi" in df_filtered.columns:
-        df_filtered["Provinsi"] = df_filtered["Provinsi"].astype(str).str.upper()
-
-    # Filters
-    if tahun and tahun.strip():
-        try:
-            df_filtered = df_filtered[df_filtered["Tahun"] == int(tahun)]
-        except Exception:
-            pass
-    if provinsi and provinsi.strip():
-        df_filtered = df_filtered[df_filtered["Provinsi"] == provinsi.upper()]
-    if ikan and ikan.strip():
-        df_filtered = df_filtered[df_filtered["Kelompok Ikan"] == ikan]
+    # Filters (Provinsi is already uppercased at load)
+    df_filtered = filter_df(tahun, provinsi, ikan)
 
     if df_filtered.empty:
-        return jsonify({"html": "<p>Tidak ada data untuk filter ini.</p>"})
-
-    status_colors = {
-        "UNDERFISHING": "#2ecc71",
-        "UNCERTAIN": "#95a5a6",
-        "DATA DEFICIENT": "#95a5a6",
-        "OVERFISHING": "#e74c3c",
-        "GROWTH OVERFISHING": "#f1c40f",
-        "RECRUITMENT OVERFISHING": "#e67e22",
-    }
+        return json_bytes({"html": "<p>Tidak ada data untuk filter ini.</p>"})
 
-    # summary text per provinsi
-    def build_info_text(subdf):
-        rows = []
-        for _, r in subdf.iterrows():
-            catch_col = "Hasil Tangkapan / Catch (Ton)" if "Hasil Tangkapan / Catch (Ton)" in subdf.columns else ("Catch" if "Catch" in subdf.columns else None)
-            catch_val = r.get("Hasil Tangkapan / Catch (Ton)", r.get("Catch", 0)) if hasattr(r, "get") else r["Hasil Tangkapan / Catch (Ton)"]
-            rows.append(f"{r['Kelompok Ikan']}: {catch_val:,} ton ({r.get('Status','')})")
-        total = subdf["Hasil Tangkapan / Catch (Ton)"].sum() if "Hasil Tangkapan / Catch (Ton)" in subdf.columns else 0
-        return "<br>".join(rows) + f"<br><br><b>Total tangkapan: {total:,.0f} ton</b>"
-
-    df_summary = df_filtered.groupby("Provinsi").apply(build_info_text).to_dict()
-    prov_status = df_filtered.groupby("Provinsi")["Status"].first().to_dict()
-
-    # Detect which property key in GeoJSON contains province name
-    prop_key = detect_prov_property_key(geojson_data["features"]) or "Provinsi"
-
-    # Attach properties to GeoJSON features
-    for feature in geojson_data["features"]:
-        props = feature.setdefault("properties", {})
-        prov_name = str(props.get(prop_key, props.get("Provinsi", ""))).upper()
-        status = prov_status.get(prov_name, "Tidak ada Data")
-        info = df_summary.get(prov_name, "Tidak ada data ikan untuk filter ini.")
-        warna = status_colors.get(status.upper(), "#dcdcdc")
+    df_summary, prov_status = summarize_provinsi(df_filtered)
 
-        props["Provinsi"] = prov_name
-        props["Status"] = status
-        props["info_ikan"] = info
-        props["warna"] = warna
+    # Attach properties to per-render copies of the GeoJSON features (geometry is shared, read-only),
+    # so concurrent renders never see each other's Status/warna/info_ikan in the cached HTML
+    features = []
+    for prov_name, feature in prov_features:
+        status, warna = prov_status.get(prov_name, ("Tidak ada Data", "#dcdcdc"))
+        info = df_summary.get(prov_name, "Tidak ada data ikan untuk filter ini.")
+        features.append({**feature, "properties": {"Provinsi": prov_name, "Status": status, "warna": warna, "info_ikan": info}})
+    geojson_render = {**geojson_data, "features": features}
 
     # Build folium map
     m = folium.Map(location=[-2.5, 118], zoom_start=5, tiles="CartoDB positron")
 
     folium.GeoJson(
-        geojson_data,
+        geojson_render,
         style_function=lambda feature: {
             "fillColor": feature["properties"].get("warna", "#dcdcdc"),
             "color": "black",
@@ -278,7 +408,7 @@ def api_peta_kepatuhan():
     """
     m.get_root().html.add_child(folium.Element(legend_html))
 
-    return jsonify({"html": m._repr_html_()})
+    return json_bytes({"html": m._repr_html_()})
 
 @app.route("/marine-law")
 def marine_law():
@@ -286,9 +416,26 @@ def marine_law():
 
 @app.route("/ecology-population")
 def ecology_population():
-    tahun_list = sorted(df["Tahun"].dropna().unique()) if not df.empty and "Tahun" in df.columns else []
-    ikan_list = sorted(df["Kelompok Ikan"].dropna().unique()) if not df.empty and "Kelompok Ikan" in df.columns else []
-    return render_template("ecology_population.html", tahun_list=tahun_list, ikan_list=ikan_list)
+    return render_template("ecology_population.html", tahun_list=TAHUN_LIST, ikan_list=IKAN_LIST)
+
+# Prediction is deterministic in its inputs, so repeat requests skip the model entirely
+@lru_cache(maxsize=100_000)
+def predict_cached(tahun, provinsi, kelompok_ikan, effort, cpue, hasil_tangkapan, tp_c, tp_e):
+    row = {
+        "Tahun": tahun,
+        "Provinsi": provinsi,
+        "Kelompok Ikan": kelompok_ikan,
+        "Effort (kapal)": effort,
+        "CPUE (Ton/Trip)": cpue,
+        "Hasil Tangkapan / Catch (Ton)": hasil_tangkapan,
+        "TP_C": tp_c,
+        "TP_E": tp_e,
+    }
+    input_data = pd.DataFrame([[row[c] for c in FEAT_ORDER]], columns=FEAT_ORDER)
+
+    print("DataFrame untuk prediksi:\n", input_data)
+
+    return str(predict_model(input_data)[0])
 
 @app.route("/api/predict-overfishing", methods=["POST"])
 def predict_overfishing():
@@ -297,40 +444,23 @@ def predict_overfishing():
         tahun = data.get("tahun")
         provinsi = data.get("provinsi")
         kelompok_ikan = data.get("kelompok_ikan")
-        effort = float(data.get("effort", 0))
-        cpue = float(data.get("cpue", 0))
-        hasil_tangkapan = float(data.get("catch", 0))
-        tp_c = float(data.get("tp_c", 0))
-        tp_e = float(data.get("tp_e", 0))
-
-        input_data = pd.DataFrame(
-            [
-                {
-                    "Tahun": int(tahun),
-                    "Provinsi": provinsi,
-                    "Kelompok Ikan": kelompok_ikan,
-                    "Effort (kapal)": effort,
-                    "CPUE (Ton/Trip)": cpue,
-                    "Hasil Tangkapan / Catch (Ton)": hasil_tangkapan,
-                    "TP_C": tp_c,
-                    "TP_E": tp_e,
-                }
-            ]
-        )
-
-        print("DataFrame untuk prediksi:\n", input_data)
+        # numeric inputs are rounded to 3 decimals so near-identical requests share a cache entry
+        effort = round(float(data.get("effort", 0)), 3)
+        cpue = round(float(data.get("cpue", 0)), 3)
+        hasil_tangkapan = round(float(data.get("catch", 0)), 3)
+        tp_c = round(float(data.get("tp_c", 0)), 3)
+        tp_e = round(float(data.get("tp_e", 0)), 3)
 
-        if model is None:
-            return jsonify({"status": "error", "message": "Model tidak tersedia di server."}), 500
+        if predict_model is None:
+            return fastjson({"status": "error", "message": "Model tidak tersedia di server."}, 500)
 
-        pred = model.predict(input_data)
-        result = str(pred[0])
+        result = predict_cached(int(tahun), provinsi, kelompok_ikan, effort, cpue, hasil_tangkapan, tp_c, tp_e)
 
-        return jsonify({"status": "success", "prediction": result, "tahun": tahun, "provinsi": provinsi, "kelompok_ikan": kelompok_ikan})
+        return fastjson({"status": "success", "prediction": result, "tahun": tahun, "provinsi": provinsi, "kelompok_ikan": kelompok_ikan})
     except Exception as e:
         print("Error saat prediksi:", str(e))
         traceback.print_exc()
-        return jsonify({"status": "error", "message": str(e)}), 500
+        return fastjson({"status": "error", "message": str(e)}, 500)
 
 # ---------- Run ----------
 if __name__ == "__main__":